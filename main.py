@@ -11,29 +11,50 @@ import sys
 import argparse
 from pathlib import Path
 
-from src.extractors.text_extractor import extract_text_from_pdf, save_text
-from src.extractors.annotation_extractor import PDFAnnotationExtractor
 from src.utils.file_utils import ensure_directory_exists, file_exists
 
 # Configuration
 DEFAULT_INPUT_DIR = "data/input"
+TEXT_OUTPUT_DIR = Path("data/output/text")
+ANNOTATIONS_OUTPUT_DIR = Path("data/output/annotations")
 DEFAULT_PDF = None  # Will be set dynamically
 
+# Pre-rendered screen blocks, written in a single call on every redraw
+_HEADER = (
+    "\n" + "=" * 60 + "\n" + "PDF EXTRACT TOOL".center(60) + "\n" + "=" * 60 + "\n"
+)
+_MENU = (
+    "\nMAIN MENU:\n"
+    "1. Extract text from PDF\n"
+    "2. Extract annotations from PDF\n"
+    "0. Exit\n" + "-" * 60 + "\n"
+)
+
+# Cached listing of PDF files in the input directory, refreshed on mtime change
+_pdf_cache = {"dir": None, "mtime": None, "files": []}
+
+
+def enable_ansi_escapes():
+    """Enable ANSI escape sequence processing on Windows consoles."""
+    if os.name == "nt":
+        # An empty command switches the console into VT processing mode
+        os.system("")
+
+
+def clear_screen():
+    """Clear the terminal using ANSI escape sequences."""
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
+
 
 def print_header():
     """Print the application header."""
-    print("\n" + "=" * 60)
-    print("PDF EXTRACT TOOL".center(60))
-    print("=" * 60)
+    sys.stdout.write(_HEADER)
 
 
 def print_menu():
     """Print the main menu options."""
-    print("\nMAIN MENU:")
-    print("1. Extract text from PDF")
-    print("2. Extract annotations from PDF")
-    print("0. Exit")
-    print("-" * 60)
+    sys.stdout.write(_MENU)
 
 
 def extract_text(pdf_path=None):
@@ -43,6 +64,9 @@ def extract_text(pdf_path=None):
     Args:
         pdf_path (str, optional): Path to the PDF file. If None, the user will be prompted.
     """
+    # Imported here so that --help and the menu do not have to load PyMuPDF
+    from src.extractors.text_extractor import extract_text_from_pdf, save_text
+
     print("\n--- TEXT EXTRACTION ---")
 
     if pdf_path is None:
@@ -65,9 +89,8 @@ def extract_text(pdf_path=None):
 
     # Determine output path
     pdf_file = Path(pdf_path)
-    output_dir = "data/output/text"
-    ensure_directory_exists(output_dir)
-    output_path = f"{output_dir}/{pdf_file.stem}_text.txt"
+    ensure_directory_exists(TEXT_OUTPUT_DIR)
+    output_path = str(TEXT_OUTPUT_DIR / f"{pdf_file.stem}_text.txt")
 
     # Save text
     save_text(text, output_path)
@@ -83,6 +106,9 @@ def extract_annotations(pdf_path=None):
     Args:
         pdf_path (str, optional): Path to the PDF file. If None, the user will be prompted.
     """
+    # Deferred import, see extract_text
+    from src.extractors.annotation_extractor import PDFAnnotationExtractor
+
     print("\n--- ANNOTATION EXTRACTION ---")
 
     if pdf_path is None:
@@ -105,9 +131,8 @@ def extract_annotations(pdf_path=None):
 
     # Determine output path
     pdf_file = Path(pdf_path)
-    output_dir = "data/output/annotations"
-    ensure_directory_exists(output_dir)
-    output_path = f"{output_dir}/{pdf_file.stem}_annotations.json"
+    ensure_directory_exists(ANNOTATIONS_OUTPUT_DIR)
+    output_path = str(ANNOTATIONS_OUTPUT_DIR / f"{pdf_file.stem}_annotations.json")
 
     # Save annotations
     extractor.save_to_json(annotations, output_path)
@@ -121,30 +146,59 @@ def extract_annotations(pdf_path=None):
     return output_path
 
 
+def list_pdf_files():
+    """
+    List the PDF files in the input directory.
+
+    The listing is cached and only rescanned when the directory's
+    modification time changes.
+
+    Returns:
+        list: Names of the PDF files, or an empty list if the directory is missing
+            or is not a directory
+    """
+    try:
+        mtime = os.stat(DEFAULT_INPUT_DIR).st_mtime_ns
+
+        if _pdf_cache["dir"] != DEFAULT_INPUT_DIR or _pdf_cache["mtime"] != mtime:
+            with os.scandir(DEFAULT_INPUT_DIR) as entries:
+                _pdf_cache["files"] = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.lower().endswith(".pdf") and entry.is_file()
+                ]
+            _pdf_cache["dir"] = DEFAULT_INPUT_DIR
+            _pdf_cache["mtime"] = mtime
+    except OSError:
+        # Missing, or not a directory
+        return []
+
+    return _pdf_cache["files"]
+
+
 def get_pdf_path():
     """Get PDF path from available files or user input."""
-    if os.path.isdir(DEFAULT_INPUT_DIR):
-        pdf_files = [f for f in os.listdir(DEFAULT_INPUT_DIR) if f.endswith(".pdf")]
-
-        if pdf_files:
-            # If there's only one PDF file, use it automatically
-            if len(pdf_files) == 1:
-                pdf_path = f"{DEFAULT_INPUT_DIR}/{pdf_files[0]}"
-                print(f"Using the only available PDF: {pdf_files[0]}")
-                return pdf_path
-
-            print("Available PDF files:")
-            for i, file in enumerate(pdf_files, 1):
-                print(f"{i}. {file}")
-
-            try:
-                choice = int(
-                    input("\nSelect a file number (or 0 to enter a different path): ")
-                )
-                if 1 <= choice <= len(pdf_files):
-                    return f"{DEFAULT_INPUT_DIR}/{pdf_files[choice-1]}"
-            except ValueError:
-                pass
+    pdf_files = list_pdf_files()
+
+    if pdf_files:
+        # If there's only one PDF file, use it automatically
+        if len(pdf_files) == 1:
+            pdf_path = os.path.join(DEFAULT_INPUT_DIR, pdf_files[0])
+            print(f"Using the only available PDF: {pdf_files[0]}")
+            return pdf_path
+
+        print("Available PDF files:")
+        for i, file in enumerate(pdf_files, 1):
+            print(f"{i}. {file}")
+
+        try:
+            choice = int(
+                input("\nSelect a file number (or 0 to enter a different path): ")
+            )
+            if 1 <= choice <= len(pdf_files):
+                return os.path.join(DEFAULT_INPUT_DIR, pdf_files[choice - 1])
+        except ValueError:
+            pass
 
     return input("Enter the path to the PDF file: ")
 
@@ -183,8 +237,9 @@ def main():
             return
 
     # Interactive menu
+    enable_ansi_escapes()
     while True:
-        os.system("cls" if os.name == "nt" else "clear")
+        clear_screen()
         print_header()
         print_menu()
 
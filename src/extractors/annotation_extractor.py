@@ -10,11 +10,34 @@ underlines, strikeouts, and more.
 import fitz  # PyMuPDF (versión actualizada)
 import json
 import argparse
+import os
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 from datetime import datetime
 
+# JSON encoder producing indented UTF-8 bytes (equivalent to indent=2 and
+# ensure_ascii=False), bound once at import: orjson if installed, else stdlib
+try:
+    import orjson  # Optional, much faster JSON serialization
+
+    def _to_json_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _to_json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Text markup annotation types whose covered text is extracted
+MARKUP_TYPES = frozenset({"Highlight", "Underline", "StrikeOut", "Squiggly"})
+
+# Buffer size for the streamed JSON output (1 MiB), so that the many small
+# per-record writes are flushed in large system calls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class PDFAnnotationExtractor:
     """Extract comments and annotations from PDF files."""
@@ -29,6 +52,38 @@ class PDFAnnotationExtractor:
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        self._doc = None
+        self._keep_open = False
+
+    def __enter__(self) -> "PDFAnnotationExtractor":
+        """Keep the document open between calls until the block exits."""
+        self._keep_open = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the document kept open by the block, if it was opened."""
+        self._keep_open = False
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def _open(self):
+        """
+        Open the PDF with PyMuPDF, which takes a plain string path.
+
+        Inside a with block the document is opened on first use and then
+        reused, so errors opening it are raised where it is first read.
+
+        Returns:
+            fitz.Document: Open PyMuPDF document
+        """
+        if self._doc is not None:
+            return self._doc
+
+        doc = fitz.open(str(self.pdf_path))
+        if self._keep_open:
+            self._doc = doc
+        return doc
 
     def extract_annotations(self) -> List[Dict[str, Any]]:
         """
@@ -37,27 +92,45 @@ class PDFAnnotationExtractor:
         Returns:
             List[Dict[str, Any]]: List of annotation dictionaries
         """
-        annotations = []
-
         try:
-            doc = fitz.open(self.pdf_path)
+            return list(self.iter_annotations())
+
+        except Exception as e:
+            print(f"Error processing PDF: {e}", file=sys.stderr)
+            return []
+
+    def iter_annotations(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the annotations of the PDF in page order.
+
+        Annotations are produced as pages are processed, so they can be
+        written out without building the whole list first. Errors opening
+        or reading the document are raised to the caller.
+
+        Yields:
+            Dict[str, Any]: Annotation data dictionary
+        """
+        doc = self._open()
+        # Only a document opened outside a with block belongs to this call
+        owns_doc = not self._keep_open
 
+        try:
             for page_num in range(len(doc)):
                 page = doc[page_num]
+
+                # Most pages carry no annotations; skip them before calling annots()
+                if page.first_annot is None:
+                    continue
+
                 page_annotations = page.annots()
 
                 for annot in page_annotations:
                     annotation_data = self._extract_annotation_data(annot, page_num + 1)
                     if annotation_data:
-                        annotations.append(annotation_data)
-
-            doc.close()
-
-        except Exception as e:
-            print(f"Error processing PDF: {e}", file=sys.stderr)
-            return []
-
-        return annotations
+                        yield annotation_data
+        finally:
+            if owns_doc:
+                doc.close()
 
     def _extract_annotation_data(self, annot, page_num: int) -> Dict[str, Any]:
         """
@@ -114,7 +187,7 @@ class PDFAnnotationExtractor:
             }
 
             # Extract highlighted text for text markup annotations
-            if annot_type in ["Highlight", "Underline", "StrikeOut", "Squiggly"]:
+            if annot_type in MARKUP_TYPES:
                 highlighted_text = self._extract_highlighted_text(annot)
                 if highlighted_text:
                     annotation_data["highlighted_text"] = highlighted_text
@@ -141,19 +214,11 @@ class PDFAnnotationExtractor:
 
             # Extract text from the annotation area using the annotation's rectangle
             rect = annot.rect
-            text_instances = page.get_text("dict", clip=rect)
-
-            # Extract text from blocks more efficiently
-            text_parts = []
-            for block in text_instances.get("blocks", []):
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line.get("spans", []):
-                            text_parts.append(span.get("text", ""))
+            # Plain text mode lets MuPDF join the spans instead of walking a dict
+            text_content = page.get_text("text", clip=rect)
 
-            # Join all text parts with a space
-            text_content = " ".join(text_parts)
-            return text_content.strip()
+            # Collapse line breaks and repeated whitespace into single spaces
+            return " ".join(text_content.split())
 
         except Exception as e:
             print(f"Error extracting highlighted text: {e}", file=sys.stderr)
@@ -161,23 +226,77 @@ class PDFAnnotationExtractor:
             
 
 
-    def save_to_json(self, annotations: List[Dict[str, Any]], output_path: str) -> None:
+    def save_to_json(
+        self, annotations: Iterable[Dict[str, Any]], output_path: str
+    ) -> None:
         """
         Save annotations to a JSON file.
 
+        A list is encoded in a single call, with total_annotations ahead of
+        the annotations. Any other iterable, such as iter_annotations(), is
+        streamed to disk one record at a time, and the count follows the
+        annotations since it is only known at the end. The data goes to a
+        temporary file next to the output, which replaces the output only
+        once everything has been written, so a failure partway through
+        never leaves a truncated JSON file behind. Errors raised by the
+        iterable are passed on to the caller.
+
         Args:
-            annotations (List[Dict[str, Any]]): List of annotations
+            annotations (Iterable[Dict[str, Any]]): Annotations to save
             output_path (str): Output file path
         """
-        output_data = {
-            "source_file": str(self.pdf_path),
-            "extraction_date": datetime.now().isoformat(),
-            "total_annotations": len(annotations),
-            "annotations": annotations,
-        }
+        tmp_path = Path(f"{output_path}.tmp")
+
+        try:
+            if isinstance(annotations, (list, tuple)):
+                output_data = {
+                    "source_file": str(self.pdf_path),
+                    "extraction_date": datetime.now().isoformat(),
+                    "total_annotations": len(annotations),
+                    "annotations": annotations,
+                }
+                with open(tmp_path, "wb") as f:
+                    f.write(_to_json_bytes(output_data))
+            else:
+                with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    self._write_streamed_json(f, annotations)
+
+            os.replace(tmp_path, output_path)
+
+        except BaseException as e:
+            tmp_path.unlink(missing_ok=True)
+            if isinstance(e, OSError) and str(tmp_path) in (e.filename, e.filename2):
+                # Report the file the caller asked for, not the temporary one
+                raise OSError(e.errno, e.strerror, output_path) from e
+            raise
+
+    def _write_streamed_json(self, f, annotations: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write annotations to an open binary file one record at a time.
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        The layout matches json.dump(indent=2), with total_annotations
+        written after the annotations.
+
+        Args:
+            f: File opened in binary write mode
+            annotations (Iterable[Dict[str, Any]]): Annotations to write
+        """
+        f.write(b'{\n  "source_file": ' + _to_json_bytes(str(self.pdf_path)))
+        f.write(
+            b',\n  "extraction_date": ' + _to_json_bytes(datetime.now().isoformat())
+        )
+        f.write(b',\n  "annotations": [')
+
+        total = 0
+        for annotation in annotations:
+            # Nest each record two levels deep, as indent=2 would
+            f.write(b",\n    " if total else b"\n    ")
+            f.write(_to_json_bytes(annotation).replace(b"\n", b"\n    "))
+            total += 1
+
+        # The count is only known once every annotation has been written
+        f.write(b"\n  ]" if total else b"]")
+        f.write(b',\n  "total_annotations": ' + str(total).encode() + b"\n}")
 
     def print_summary(self, annotations: List[Dict[str, Any]]) -> None:
         """
@@ -194,13 +313,10 @@ class PDFAnnotationExtractor:
         print("-" * 50)
 
         # Group by type
-        type_counts = {}
-        for annot in annotations:
-            annot_type = annot["type"]
-            type_counts[annot_type] = type_counts.get(annot_type, 0) + 1
+        type_counts = Counter(annot["type"] for annot in annotations)
 
         print("Annotation types:")
-        for annot_type, count in sorted(type_counts.items()):
+        for annot_type, count in type_counts.most_common():
             print(f"  {annot_type}: {count}")
 
         print("\nDetailed annotations:")
@@ -216,8 +332,6 @@ class PDFAnnotationExtractor:
                 print(f"   Highlighted text: {annot['highlighted_text']}")
 
 
-
-
 def main():
     """Main function to run the PDF annotation extractor."""
     parser = argparse.ArgumentParser(
@@ -240,15 +354,29 @@ def main():
         sys.exit(0)
 
     try:
-        extractor = PDFAnnotationExtractor(args.pdf_file)
-        annotations = extractor.extract_annotations()
-
-        if args.output:
-            extractor.save_to_json(annotations, args.output)
-            print(f"Annotations saved to {args.output}")
-
-        if args.summary or not args.output:
-            extractor.print_summary(annotations)
+        with PDFAnnotationExtractor(args.pdf_file) as extractor:
+            if args.output and not args.summary:
+                # The list is not needed afterwards, stream straight to the file
+                try:
+                    extractor.save_to_json(extractor.iter_annotations(), args.output)
+                except OSError:
+                    # Writing the output failed
+                    raise
+                except Exception as e:
+                    # Same outcome as extract_annotations(): log, save no annotations
+                    print(f"Error processing PDF: {e}", file=sys.stderr)
+                    extractor.save_to_json([], args.output)
+                print(f"Annotations saved to {args.output}")
+                return
+
+            annotations = extractor.extract_annotations()
+
+            if args.output:
+                extractor.save_to_json(annotations, args.output)
+                print(f"Annotations saved to {args.output}")
+
+            if args.summary or not args.output:
+                extractor.print_summary(annotations)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -25,9 +25,8 @@ def extract_text_from_pdf(pdf_path, by_page=False, include_numbers=True):
         # Open the PDF document
         document = fitz.open(pdf_path)
 
-        if by_page:
-            # Extract text by page
-            result = {}
+        try:
+            texts = []
             for page_num in range(len(document)):
                 page = document[page_num]
                 text = page.get_text()
@@ -36,24 +35,16 @@ def extract_text_from_pdf(pdf_path, by_page=False, include_numbers=True):
                     # Add page number at the beginning
                     text = f"=== PAGE {page_num + 1} ===\n\n{text}"
 
-                result[page_num + 1] = text
+                texts.append(text)
+        finally:
+            document.close()
 
-            return result
+        if by_page:
+            # Extract text by page
+            return {page_num: text for page_num, text in enumerate(texts, 1)}
         else:
-            # Extract all text as a single string
-            complete_text = ""
-
-            for page_num in range(len(document)):
-                page = document[page_num]
-                text = page.get_text()
-
-                if include_numbers:
-                    # Add page number at the beginning
-                    text = f"=== PAGE {page_num + 1} ===\n\n{text}"
-
-                complete_text += text + "\n\n"
-
-            return complete_text
+            # Extract all text as a single string, each page followed by a blank line
+            return "".join(f"{text}\n\n" for text in texts)
 
     except Exception as e:
         print(f"Error extracting text from PDF: {e}", file=sys.stderr)
@@ -4,15 +4,14 @@ Utility functions for file operations
 """
 
 import os
-from pathlib import Path
 
 
-def ensure_directory_exists(directory_path: str) -> None:
+def ensure_directory_exists(directory_path: str | os.PathLike) -> None:
     """
     Ensure that a directory exists, creating it if necessary.
 
     Args:
-        directory_path (str): Path to the directory
+        directory_path (str | os.PathLike): Path to the directory
     """
     os.makedirs(directory_path, exist_ok=True)
 
@@ -27,4 +26,4 @@ def file_exists(file_path: str) -> bool:
     Returns:
         bool: True if the file exists, False otherwise
     """
-    return Path(file_path).is_file()
+    return os.path.isfile(file_path)